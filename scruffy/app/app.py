@@ -15,7 +15,7 @@ from scruffy.services import EmailService
 from scruffy.settings import settings
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Result:
     remind: bool
     delete: bool
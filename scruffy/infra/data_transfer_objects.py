@@ -5,7 +5,7 @@ from typing import Literal, Union
 from .constants import MediaStatus, RequestStatus
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RequestDTO:
     user_id: int
     user_email: str
@@ -33,7 +33,7 @@ class RequestDTO:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MediaInfoDTO:
     """
     Returned Media information from Sonarr or Radarr API.
@@ -28,8 +28,8 @@ class OverseerRepository:
         total_requests = await self.get_request_count(filter_status)
         all_requests = []
 
-        while skip < total_requests:
-            async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient() as client:
+            while skip < total_requests:
                 params = {"take": take, "skip": skip}
                 if filter_status:
                     params["filter"] = filter_status
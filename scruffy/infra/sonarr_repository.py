@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime
 
 import httpx
@@ -6,6 +7,9 @@ from scruffy.infra.data_transfer_objects import MediaInfoDTO
 
 
 class SonarrRepository:
+    # Upper bound on concurrent episode file DELETEs sent to Sonarr
+    max_concurrent_deletes = 10
+
     def __init__(self, base_url: str, api_key: str):
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
@@ -156,17 +160,27 @@ class SonarrRepository:
             await self.delete_episode_files(episode_file_ids)
 
     async def delete_episode_files(self, episode_file_ids: list[int]) -> None:
-        """Delete episode files by their Sonarr internal IDs one at a time.
+        """Delete episode files by their Sonarr internal IDs concurrently.
         Note: We should use episodefile/bulk DETELE instead, but the json
         arg needed for this endpoint is slightly more complex and problematic.
         """
-        async with httpx.AsyncClient() as client:
-            for episode_id in episode_file_ids:
+        semaphore = asyncio.Semaphore(self.max_concurrent_deletes)
+
+        async def delete_file(client: httpx.AsyncClient, episode_id: int) -> None:
+            async with semaphore:
                 response = await client.delete(
                     f"{self.base_url}/api/v3/episodefile/{episode_id}",
                     headers=self.headers,
                 )
-                response.raise_for_status()
+            response.raise_for_status()
+
+        try:
+            # TaskGroup cancels and awaits the remaining DELETEs on first failure
+            async with httpx.AsyncClient() as client, asyncio.TaskGroup() as tg:
+                for episode_id in episode_file_ids:
+                    tg.create_task(delete_file(client, episode_id))
+        except ExceptionGroup as group:
+            raise group.exceptions[0] from None
 
     async def update_season_monitoring(
         self, series_id: int, seasons_to_unmonitor: list[int]
@@ -11,9 +11,16 @@ def setup_logger(
     log_file: Optional[Path] = None,
     format_string: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 ) -> logging.Logger:
-    """Configure and return a logger instance."""
+    """Configure and return a logger instance.
+
+    Handlers are only attached the first time a logger is configured, so
+    calling this again for the same name does not duplicate output.
+    """
     logger = logging.getLogger(name)
     logger.setLevel(level.upper())
+    if logger.handlers:
+        return logger
+
     formatter = logging.Formatter(format_string)
 
     # Console handler
@@ -1,31 +1,61 @@
+from dataclasses import replace
 from datetime import datetime, timedelta, timezone
-from unittest.mock import AsyncMock
+from unittest.mock import create_autospec
 
 import pytest
 
 from scruffy.app.app import MediaManager, Result
 from scruffy.infra.constants import MediaStatus, RequestStatus
 from scruffy.infra.data_transfer_objects import MediaInfoDTO, RequestDTO
+from scruffy.infra.overseer_repository import OverseerRepository
+from scruffy.infra.radarr_repository import RadarrRepository
+from scruffy.infra.sonarr_repository import SonarrRepository
+from scruffy.services.email_service import EmailService
+
+
+def _reset(mock):
+    mock.reset_mock(return_value=True, side_effect=True)
+    return mock
+
+
+@pytest.fixture(scope="module")
+def _overseer_spec():
+    return create_autospec(OverseerRepository, instance=True)
+
+
+@pytest.fixture(scope="module")
+def _sonarr_spec():
+    return create_autospec(SonarrRepository, instance=True)
+
+
+@pytest.fixture(scope="module")
+def _radarr_spec():
+    return create_autospec(RadarrRepository, instance=True)
+
+
+@pytest.fixture(scope="module")
+def _email_spec():
+    return create_autospec(EmailService, instance=True)
 
 
 @pytest.fixture
-def mock_overseer():
-    return AsyncMock(get_requests=AsyncMock(), delete_request=AsyncMock())
+def mock_overseer(_overseer_spec):
+    return _reset(_overseer_spec)
 
 
 @pytest.fixture
-def mock_sonarr():
-    return AsyncMock(get_series_info=AsyncMock(), delete_series_seasons=AsyncMock())
+def mock_sonarr(_sonarr_spec):
+    return _reset(_sonarr_spec)
 
 
 @pytest.fixture
-def mock_radarr():
-    return AsyncMock(get_movie=AsyncMock(), delete_movie=AsyncMock())
+def mock_radarr(_radarr_spec):
+    return _reset(_radarr_spec)
 
 
 @pytest.fixture
-def mock_email():
-    return AsyncMock(send_reminder_notice=AsyncMock(), send_deletion_notice=AsyncMock())
+def mock_email(_email_spec):
+    return _reset(_email_spec)
 
 
 @pytest.fixture
@@ -38,7 +68,7 @@ def manager(mock_overseer, mock_sonarr, mock_radarr, mock_email):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_movie_request():
     return RequestDTO(
         user_id=1,
@@ -53,22 +83,7 @@ def sample_movie_request():
     )
 
 
-@pytest.fixture
-def sample_movie_remind_request():
-    return RequestDTO(
-        user_id=2,
-        user_email="test@example.com",
-        type="movie",
-        request_id=1,
-        request_status=RequestStatus.APPROVED,
-        updated_at=datetime.now(timezone.utc) - timedelta(days=23),
-        media_status=MediaStatus.AVAILABLE,
-        external_service_id=102,
-        seasons=[],
-    )
-
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_tv_request():
     return RequestDTO(
         user_id=1,
@@ -83,7 +98,7 @@ def sample_tv_request():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_media_info():
     return MediaInfoDTO(
         available=True,
@@ -96,41 +111,24 @@ def sample_media_info():
     )
 
 
-@pytest.fixture
-def sample_media_remind_info():
-    return MediaInfoDTO(
-        available=True,
-        available_since=datetime.now(timezone.utc) - timedelta(days=23),
-        id=2,
-        poster="test.jpg",
-        seasons=[1],
-        size_on_disk=1000,
-        title="Test Media",
-    )
-
-
-@pytest.mark.asyncio
-async def test_check_requests_movie(
-    manager, mock_overseer, sample_movie_request, sample_media_info
+@pytest.mark.parametrize(
+    "request_fixture,target,method",
+    [
+        ("sample_movie_request", "radarr", "get_movie"),
+        ("sample_tv_request", "sonarr", "get_series_info"),
+    ],
+    ids=["movie", "tv"],
+)
+async def test_check_requests(
+    manager, mock_overseer, sample_media_info, request, request_fixture, target, method
 ):
-    mock_overseer.get_requests.return_value = [sample_movie_request]
-    manager.radarr.get_movie.return_value = sample_media_info
+    media_request = request.getfixturevalue(request_fixture)
+    mock_overseer.get_requests.return_value = [media_request]
+    getattr(getattr(manager, target), method).return_value = sample_media_info
 
     results = await manager.check_requests()
     assert len(results) == 1
-    assert results[0] == (sample_movie_request, sample_media_info)
-
-
-@pytest.mark.asyncio
-async def test_check_requests_tv(
-    manager, mock_overseer, sample_tv_request, sample_media_info
-):
-    mock_overseer.get_requests.return_value = [sample_tv_request]
-    manager.sonarr.get_series_info.return_value = sample_media_info
-
-    results = await manager.check_requests()
-    assert len(results) == 1
-    assert results[0] == (sample_tv_request, sample_media_info)
+    assert results[0] == (media_request, sample_media_info)
 
 
 def test_check_retention_policy(manager, sample_movie_request, sample_media_info):
@@ -140,57 +138,55 @@ def test_check_retention_policy(manager, sample_movie_request, sample_media_info
     assert result.remind is False
 
 
-@pytest.mark.asyncio
-async def test_process_media_delete(
+@pytest.mark.parametrize(
+    "age_days,expect_delete", [(31, True), (23, False)], ids=["delete", "remind"]
+)
+async def test_process_media(
     manager,
     mock_overseer,
     mock_radarr,
     mock_email,
     sample_movie_request,
     sample_media_info,
+    age_days,
+    expect_delete,
 ):
-    mock_overseer.get_requests.return_value = [sample_movie_request]
+    movie_request = replace(
+        sample_movie_request,
+        updated_at=datetime.now(timezone.utc) - timedelta(days=age_days),
+    )
+    mock_overseer.get_requests.return_value = [movie_request]
     manager.radarr.get_movie.return_value = sample_media_info
 
     await manager.process_media()
 
-    mock_radarr.delete_movie.assert_called_once_with(
-        sample_movie_request.external_service_id
-    )
-    mock_overseer.delete_request.assert_called_once_with(
-        sample_movie_request.request_id
-    )
-    mock_email.send_deletion_notice.assert_called_once()
-
-
-@pytest.mark.asyncio
-async def test_process_media_remind(
-    manager,
-    mock_overseer,
-    mock_email,
-    sample_movie_remind_request,
-    sample_media_remind_info,
+    if expect_delete:
+        mock_radarr.delete_movie.assert_called_once_with(
+            movie_request.external_service_id
+        )
+        mock_overseer.delete_request.assert_called_once_with(movie_request.request_id)
+        mock_email.send_deletion_notice.assert_called_once()
+        mock_email.send_reminder_notice.assert_not_called()
+    else:
+        mock_email.send_reminder_notice.assert_called_once()
+        mock_overseer.delete_request.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "request_fixture,target,method,with_seasons",
+    [
+        ("sample_movie_request", "radarr", "delete_movie", False),
+        ("sample_tv_request", "sonarr", "delete_series_seasons", True),
+    ],
+    ids=["movie", "tv"],
+)
+async def test_delete_media(
+    manager, request, request_fixture, target, method, with_seasons
 ):
-    mock_overseer.get_requests.return_value = [sample_movie_remind_request]
-    manager.radarr.get_movie.return_value = sample_media_remind_info
-
-    await manager.process_media()
-
-    mock_email.send_reminder_notice.assert_called_once()
-    mock_overseer.delete_request.assert_not_called()
+    media_request = request.getfixturevalue(request_fixture)
+    expected_args = (media_request.external_service_id,)
+    if with_seasons:
+        expected_args += (media_request.seasons,)
 
-
-@pytest.mark.asyncio
-async def test_delete_media_movie(manager, mock_radarr, sample_movie_request):
-    await manager._delete_media(sample_movie_request)
-    mock_radarr.delete_movie.assert_called_once_with(
-        sample_movie_request.external_service_id
-    )
-
-
-@pytest.mark.asyncio
-async def test_delete_media_tv(manager, mock_sonarr, sample_tv_request):
-    await manager._delete_media(sample_tv_request)
-    mock_sonarr.delete_series_seasons.assert_called_once_with(
-        sample_tv_request.external_service_id, sample_tv_request.seasons
-    )
+    await manager._delete_media(media_request)
+    getattr(getattr(manager, target), method).assert_called_once_with(*expected_args)
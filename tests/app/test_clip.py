@@ -1,102 +1,102 @@
 from datetime import datetime, timedelta, timezone
-from unittest.mock import patch
+from unittest.mock import AsyncMock
 
 import pytest
 from typer.testing import CliRunner
 
+from scruffy.app import cli
 from scruffy.app.cli import app
 from scruffy.infra.constants import MediaStatus, RequestStatus
 from scruffy.infra.data_transfer_objects import MediaInfoDTO, RequestDTO
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def runner():
     return CliRunner()
 
 
-@pytest.fixture
-def mock_settings():
-    with patch("scruffy.app.cli.settings") as mock:
-        mock.overseerr_url = "http://test.com"
-        mock.overseerr_api_key = "test-key"
-        mock.sonarr_url = "http://test.com"
-        mock.sonarr_api_key = "test-key"
-        mock.radarr_url = "http://test.com"
-        mock.radarr_api_key = "test-key"
-        mock.email_enabled = True
-        mock.retention_days = 30
-        mock.reminder_days = 7
-        mock.log_level = "INFO"
-        yield mock
-
-
-@pytest.fixture
-def sample_request():
-    return RequestDTO(
+def _make_check_result(age_days: int = 25):
+    """Build a (request, media) pair as returned by async_check_media."""
+    updated_at = datetime.now(timezone.utc) - timedelta(days=age_days)
+    request = RequestDTO(
         user_id=1,
         user_email="test@test.com",
         type="movie",
         request_id=1,
         request_status=RequestStatus.APPROVED,
-        updated_at=datetime.now(timezone.utc) - timedelta(days=25),
+        updated_at=updated_at,
         media_status=MediaStatus.AVAILABLE,
         external_service_id=1,
         seasons=[],
     )
-
-
-@pytest.fixture
-def sample_media():
-    return MediaInfoDTO(
+    media = MediaInfoDTO(
         title="Test Movie",
         available=True,
-        available_since=datetime.now(timezone.utc) - timedelta(days=25),
+        available_since=updated_at,
         poster="test.jpg",
         seasons=[],
         size_on_disk=1000,
         id=1,
     )
+    return request, media
+
+
+DELETE_RESULT = _make_check_result(31)
+REMIND_RESULT = _make_check_result(25)
+KEEP_RESULT = _make_check_result(5)
 
 
-def test_validate_command_success(runner, mock_settings):
+@pytest.fixture
+def mock_check(monkeypatch):
+    mock = AsyncMock()
+    monkeypatch.setattr(cli, "async_check_media", mock)
+    return mock
+
+
+@pytest.fixture
+def mock_process(monkeypatch):
+    mock = AsyncMock(return_value=None)
+    monkeypatch.setattr(cli, "async_process_media", mock)
+    return mock
+
+
+def test_validate_command_success(runner, configured_settings):
     result = runner.invoke(app, ["validate"])
     assert result.exit_code == 0
     assert "✓ Configuration is valid" in result.stdout
 
 
-@patch("scruffy.app.cli.async_check_media")
-def test_check_command_with_media(mock_check, runner, sample_request, sample_media):
-    async def mock_results():
-        return [(sample_request, sample_media)]
-
-    mock_check.side_effect = mock_results
+@pytest.mark.parametrize(
+    "check_result,age_days,action",
+    [
+        (DELETE_RESULT, 31, "Delete"),
+        (REMIND_RESULT, 25, "Remind"),
+        (KEEP_RESULT, 5, "Keep"),
+    ],
+    ids=["delete", "remind", "keep"],
+)
+def test_check_command_with_media(
+    mock_check, runner, configured_settings, check_result, age_days, action
+):
+    mock_check.return_value = [check_result]
 
     result = runner.invoke(app, ["check"])
     assert result.exit_code == 0
     assert "Test Movie" in result.stdout
     assert "movie" in result.stdout
-    assert "25" in result.stdout
-    assert "Remind" in result.stdout
+    assert str(age_days) in result.stdout
+    assert action in result.stdout
 
 
-@patch("scruffy.app.cli.async_check_media")
 def test_check_command_no_media(mock_check, runner):
-    async def mock_results():
-        return []
-
-    mock_check.side_effect = mock_results
+    mock_check.return_value = []
 
     result = runner.invoke(app, ["check"])
     assert result.exit_code == 0
     assert "No media found to process" in result.stdout
 
 
-@patch("scruffy.app.cli.async_process_media")
 def test_process_command_success(mock_process, runner):
-    async def mock_processing():
-        return None
-
-    mock_process.side_effect = mock_processing
-
     result = runner.invoke(app, ["process"])
     assert result.exit_code == 0
+    mock_process.assert_awaited_once()
@@ -0,0 +1,32 @@
+from unittest.mock import patch
+
+import pytest
+
+from scruffy.settings import settings
+
+TEST_SETTINGS = {
+    "overseerr_url": "http://test.com",
+    "overseerr_api_key": "test-key",
+    "sonarr_url": "http://test.com",
+    "sonarr_api_key": "test-key",
+    "radarr_url": "http://test.com",
+    "radarr_api_key": "test-key",
+    "retention_days": 30,
+    "reminder_days": 7,
+    "email_enabled": True,
+    "smtp_host": "smtp.test.com",
+    "smtp_port": 587,
+    "smtp_username": "test",
+    "smtp_password": "test",
+    "smtp_from_email": "from@test.com",
+    "smtp_ssl_tls": False,
+    "smtp_starttls": True,
+    "log_level": "INFO",
+}
+
+
+@pytest.fixture(scope="session")
+def configured_settings():
+    """Apply the test configuration to the shared settings object once."""
+    with patch.multiple(settings, **TEST_SETTINGS):
+        yield settings
@@ -0,0 +1,43 @@
+import pytest
+import respx
+
+CALL_REPORT = pytest.StashKey[pytest.TestReport]()
+
+
+@pytest.hookimpl(wrapper=True, tryfirst=True)
+def pytest_runtest_makereport(item, call):
+    report = yield
+    if report.when == "call":
+        item.stash[CALL_REPORT] = report
+    return report
+
+
+@pytest.fixture(scope="session")
+def base_url():
+    return "http://test.com"
+
+
+@pytest.fixture(scope="session")
+def api_key():
+    return "test-api-key"
+
+
+@pytest.fixture(scope="module")
+def respx_router(base_url):
+    """Patch httpx once per test module, never past the infra tests."""
+    with respx.mock(base_url=base_url) as router:
+        yield router
+
+
+@pytest.fixture
+def respx_mock(request, respx_router):
+    """Shared router, with routes and calls rolled back after each test."""
+    respx_router.snapshot()
+    yield respx_router
+    try:
+        # Like respx.mock, only check unused routes when the test body passed
+        report = request.node.stash.get(CALL_REPORT, None)
+        if report is not None and report.passed:
+            respx_router.assert_all_called()
+    finally:
+        respx_router.rollback()
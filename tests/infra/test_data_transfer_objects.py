@@ -1,8 +1,14 @@
+from dataclasses import FrozenInstanceError, asdict
 from datetime import datetime
 
+import pytest
+
 from scruffy.infra.constants import MediaStatus, RequestStatus
 from scruffy.infra.data_transfer_objects import MediaInfoDTO, RequestDTO
 
+JAN_1_2023 = datetime(2023, 1, 1)
+UPDATED_AT_NOON = datetime(2023, 1, 1, 12, 0, 0)
+
 
 def test_request_dto_creation():
     request = RequestDTO(
@@ -11,20 +17,23 @@ def test_request_dto_creation():
         type="movie",
         request_id=100,
         request_status=RequestStatus.PENDING_APPROVAL,
-        updated_at=datetime(2023, 1, 1),
+        updated_at=JAN_1_2023,
         media_status=MediaStatus.AVAILABLE,
         external_service_id=1000,
         seasons=[],
     )
 
-    assert request.user_id == 1
-    assert request.user_email == "test@example.com"
-    assert request.type == "movie"
-    assert request.request_id == 100
-    assert request.request_status == RequestStatus.PENDING_APPROVAL
-    assert request.media_status == MediaStatus.AVAILABLE
-    assert request.external_service_id == 1000
-    assert request.seasons == []
+    assert asdict(request) == {
+        "user_id": 1,
+        "user_email": "test@example.com",
+        "type": "movie",
+        "request_id": 100,
+        "request_status": RequestStatus.PENDING_APPROVAL,
+        "updated_at": JAN_1_2023,
+        "media_status": MediaStatus.AVAILABLE,
+        "external_service_id": 1000,
+        "seasons": [],
+    }
 
 
 def test_request_dto_from_overseer_movie_response():
@@ -44,7 +53,7 @@ def test_request_dto_from_overseer_movie_response():
     assert request.user_id == 1
     assert request.type == "movie"
     assert request.seasons == []
-    assert request.updated_at == datetime(2023, 1, 1, 12, 0, 0)
+    assert request.updated_at == UPDATED_AT_NOON
 
 
 def test_request_dto_from_overseer_tv_response():
@@ -70,7 +79,7 @@ def test_request_dto_from_overseer_tv_response():
 
 def test_media_info_dto_creation():
     media = MediaInfoDTO(
-        available_since=datetime(2023, 1, 1),
+        available_since=JAN_1_2023,
         available=True,
         id=100,
         poster="http://example.com/poster.jpg",
@@ -79,13 +88,15 @@ def test_media_info_dto_creation():
         title="Test Media",
     )
 
-    assert media.available_since == datetime(2023, 1, 1)
-    assert media.available is True
-    assert media.id == 100
-    assert media.poster == "http://example.com/poster.jpg"
-    assert media.seasons == [1, 2, 3]
-    assert media.size_on_disk == 1000000
-    assert media.title == "Test Media"
+    assert asdict(media) == {
+        "available_since": JAN_1_2023,
+        "available": True,
+        "id": 100,
+        "poster": "http://example.com/poster.jpg",
+        "seasons": [1, 2, 3],
+        "size_on_disk": 1000000,
+        "title": "Test Media",
+    }
 
 
 def test_media_info_dto_with_none_available_since():
@@ -102,3 +113,40 @@ def test_media_info_dto_with_none_available_since():
     assert media.available_since is None
     assert media.available is False
     assert media.seasons == []
+
+
+@pytest.mark.parametrize(
+    "dto,field",
+    [
+        (
+            RequestDTO(
+                user_id=1,
+                user_email="test@example.com",
+                type="movie",
+                request_id=100,
+                request_status=RequestStatus.APPROVED,
+                updated_at=JAN_1_2023,
+                media_status=MediaStatus.AVAILABLE,
+                external_service_id=1000,
+                seasons=[],
+            ),
+            "request_id",
+        ),
+        (
+            MediaInfoDTO(
+                available_since=JAN_1_2023,
+                available=True,
+                id=100,
+                poster="",
+                seasons=[],
+                size_on_disk=0,
+                title="Test Media",
+            ),
+            "title",
+        ),
+    ],
+    ids=["request", "media_info"],
+)
+def test_dto_is_immutable(dto, field):
+    with pytest.raises(FrozenInstanceError):
+        setattr(dto, field, None)
@@ -0,0 +1,38 @@
+import pytest
+
+from scruffy.infra import OverseerRepository, RadarrRepository, SonarrRepository
+
+
+@pytest.mark.parametrize(
+    "repository_class", [OverseerRepository, RadarrRepository, SonarrRepository]
+)
+def test_repository_initialization(repository_class, base_url, api_key):
+    repo = repository_class(base_url, api_key)
+    assert repo.base_url == base_url
+    assert repo.api_key == api_key
+    assert repo.headers == {"X-Api-Key": api_key, "Accept": "application/json"}
+
+
+@pytest.mark.parametrize(
+    "repository_class,method",
+    [(RadarrRepository, "_get_movie_poster"), (SonarrRepository, "_get_series_poster")],
+    ids=["radarr", "sonarr"],
+)
+@pytest.mark.parametrize(
+    "images,expected",
+    [
+        (
+            [
+                {"coverType": "poster", "remoteUrl": "http://test.com/poster.jpg"},
+                {"coverType": "fanart", "remoteUrl": "http://test.com/fanart.jpg"},
+            ],
+            "http://test.com/poster.jpg",
+        ),
+        ([{"coverType": "fanart", "remoteUrl": "http://test.com/fanart.jpg"}], None),
+        ([], None),
+    ],
+    ids=["poster", "no_poster", "empty_images"],
+)
+def test_get_poster(repository_class, method, images, expected, base_url, api_key):
+    repo = repository_class(base_url, api_key)
+    assert getattr(repo, method)(images) == expected
@@ -1,252 +1,241 @@
+import asyncio
 import json
 from datetime import datetime, timezone
 
 import httpx
 import pytest
-import respx
 
 from scruffy.infra.data_transfer_objects import MediaInfoDTO
 from scruffy.infra.sonarr_repository import SonarrRepository
 
-
-@pytest.fixture
-def base_url():
-    return "http://test.com"
-
-
-@pytest.fixture
-def api_key():
-    return "test-api-key"
-
-
-@pytest.fixture
+LATEST_EPISODE_ADDED_AT = datetime(2024, 1, 2, 12, 0, tzinfo=timezone.utc)
+
+MOCK_SERIES_RESPONSE = {
+    "id": 1,
+    "title": "Test Series",
+    "images": [{"coverType": "poster", "remoteUrl": "http://test.com/poster.jpg"}],
+    "seasons": [
+        {"seasonNumber": 1, "monitored": True},
+        {"seasonNumber": 2, "monitored": True},
+    ],
+}
+MOCK_SERIES_HTTP_RESPONSE = httpx.Response(200, json=MOCK_SERIES_RESPONSE)
+
+MOCK_EPISODES_RESPONSE = [
+    {
+        "seasonNumber": 1,
+        "episodeNumber": 1,
+        "hasFile": True,
+        "episodeFileId": 101,
+        "episodeFile": {
+            "dateAdded": "2024-01-01T12:00:00Z",
+            "size": 500000,
+        },
+    },
+    {
+        "seasonNumber": 1,
+        "episodeNumber": 2,
+        "hasFile": True,
+        "episodeFileId": 102,
+        "episodeFile": {
+            "dateAdded": "2024-01-02T12:00:00Z",
+            "size": 500000,
+        },
+    },
+]
+MOCK_EPISODES_HTTP_RESPONSE = httpx.Response(200, json=MOCK_EPISODES_RESPONSE)
+
+# Variants of the episode list, overlaid on the base payload
+MOCK_EPISODES_MISSING_FILE_HTTP_RESPONSE = httpx.Response(
+    200,
+    json=[{**MOCK_EPISODES_RESPONSE[0], "hasFile": False}, *MOCK_EPISODES_RESPONSE[1:]],
+)
+MOCK_EPISODES_WITHOUT_FILE_INFO_HTTP_RESPONSE = httpx.Response(
+    200,
+    json=[
+        {key: value for key, value in episode.items() if key != "episodeFile"}
+        for episode in MOCK_EPISODES_RESPONSE[:1]
+    ],
+)
+
+
+@pytest.fixture(scope="session")
 def repo(base_url, api_key):
     return SonarrRepository(base_url, api_key)
 
 
 @pytest.fixture
-def mock_series_response():
-    return {
-        "id": 1,
-        "title": "Test Series",
-        "images": [{"coverType": "poster", "remoteUrl": "http://test.com/poster.jpg"}],
-        "seasons": [
-            {"seasonNumber": 1, "monitored": True},
-            {"seasonNumber": 2, "monitored": True},
-        ],
-    }
+def series_route(respx_mock):
+    return respx_mock.get("/api/v3/series/1").mock(
+        return_value=MOCK_SERIES_HTTP_RESPONSE
+    )
 
 
 @pytest.fixture
-def mock_episodes_response():
-    return [
-        {
-            "seasonNumber": 1,
-            "episodeNumber": 1,
-            "hasFile": True,
-            "episodeFileId": 101,
-            "episodeFile": {
-                "dateAdded": "2024-01-01T12:00:00Z",
-                "size": 500000,
-            },
-        },
-        {
-            "seasonNumber": 1,
-            "episodeNumber": 2,
-            "hasFile": True,
-            "episodeFileId": 102,
-            "episodeFile": {
-                "dateAdded": "2024-01-02T12:00:00Z",
-                "size": 500000,
-            },
-        },
-    ]
+def episodes_route(respx_mock):
+    return respx_mock.get("/api/v3/episode").mock(
+        return_value=MOCK_EPISODES_HTTP_RESPONSE
+    )
 
 
-def test_repository_initialization(base_url, api_key):
-    repo = SonarrRepository(base_url, api_key)
-    assert repo.base_url == base_url
-    assert repo.api_key == api_key
-    assert repo.headers == {"X-Api-Key": api_key, "Accept": "application/json"}
+async def test_get_series(repo, series_route):
+    result = await repo.get_series(1)
+    assert result == MOCK_SERIES_RESPONSE
 
 
-def test_get_series_poster():
-    repo = SonarrRepository("http://test.com", "test-key")
-    images = [
-        {"coverType": "poster", "remoteUrl": "http://test.com/poster.jpg"},
-        {"coverType": "fanart", "remoteUrl": "http://test.com/fanart.jpg"},
-    ]
-    assert repo._get_series_poster(images) == "http://test.com/poster.jpg"
+async def test_get_series_info(repo, series_route, episodes_route):
+    result = await repo.get_series_info(1, [1])
+    assert isinstance(result, MediaInfoDTO)
+    assert result.title == "Test Series"
+    assert result.available is True
+    assert result.poster == "http://test.com/poster.jpg"
+    assert result.available_since == LATEST_EPISODE_ADDED_AT
+    assert result.size_on_disk == 1000000
+    assert result.seasons == [1]
 
 
-def test_get_series_poster_no_poster():
-    repo = SonarrRepository("http://test.com", "test-key")
-    images = [{"coverType": "fanart", "remoteUrl": "http://test.com/fanart.jpg"}]
-    assert repo._get_series_poster(images) is None
+async def test_get_series_info_unavailable(repo, series_route, episodes_route):
+    episodes_route.mock(return_value=MOCK_EPISODES_MISSING_FILE_HTTP_RESPONSE)
 
+    result = await repo.get_series_info(1, [1])
+    assert result.available is False
+    assert result.available_since is None
 
-@pytest.mark.asyncio
-async def test_get_series(repo, base_url, mock_series_response):
-    with respx.mock(base_url=base_url) as respx_mock:
-        respx_mock.get("/api/v3/series/1").mock(
-            return_value=httpx.Response(200, json=mock_series_response)
-        )
 
-        result = await repo.get_series(1)
-        assert result == mock_series_response
+async def test_get_episodes(repo, episodes_route):
+    result = await repo.get_episodes(1, 1)
+    assert result == MOCK_EPISODES_RESPONSE
+    assert dict(episodes_route.calls.last.request.url.params) == {
+        "seriesId": "1",
+        "seasonNumber": "1",
+        "includeEpisodeFile": "true",
+    }
 
 
-@pytest.mark.asyncio
-async def test_get_series_info(
-    repo, base_url, mock_series_response, mock_episodes_response
+async def test_delete_series_seasons(repo, respx_mock, series_route, episodes_route):
+    put_series = respx_mock.put("/api/v3/series/1").mock(
+        return_value=httpx.Response(200)
+    )
+    episodes_route.mock(return_value=MOCK_EPISODES_WITHOUT_FILE_INFO_HTTP_RESPONSE)
+    delete_file = respx_mock.delete("/api/v3/episodefile/101").mock(
+        return_value=httpx.Response(200)
+    )
+
+    await repo.delete_series_seasons(1, [1])
+
+    # Verify all expected calls were made
+    assert series_route.called
+    assert put_series.called
+    assert episodes_route.called
+    assert delete_file.called
+
+    # Verify the PUT request updated monitoring
+    put_request = put_series.calls.last.request
+    sent_data = json.loads(put_request.read())
+    assert sent_data["seasons"][0]["monitored"] is False
+
+
+async def test_delete_season_files(repo, respx_mock, episodes_route):
+    delete_101 = respx_mock.delete("/api/v3/episodefile/101").mock(
+        return_value=httpx.Response(200)
+    )
+    delete_102 = respx_mock.delete("/api/v3/episodefile/102").mock(
+        return_value=httpx.Response(200)
+    )
+
+    await repo.delete_season_files(1, [1])
+    assert delete_101.call_count == 1
+    assert delete_102.call_count == 1
+
+
+async def test_delete_episode_files(repo, respx_mock):
+    delete_101 = respx_mock.delete("/api/v3/episodefile/101").mock(
+        return_value=httpx.Response(200)
+    )
+    delete_102 = respx_mock.delete("/api/v3/episodefile/102").mock(
+        return_value=httpx.Response(200)
+    )
+
+    await repo.delete_episode_files([101, 102])
+    assert delete_101.call_count == 1
+    assert delete_102.call_count == 1
+
+
+@pytest.mark.parametrize(
+    "max_concurrent,expected_in_flight", [(10, 3), (2, 2)], ids=["all", "bounded"]
+)
+async def test_delete_episode_files_concurrently(
+    repo, respx_mock, monkeypatch, max_concurrent, expected_in_flight
 ):
-    with respx.mock(base_url=base_url) as respx_mock:
-        respx_mock.get("/api/v3/series/1").mock(
-            return_value=httpx.Response(200, json=mock_series_response)
-        )
-        respx_mock.get("/api/v3/episode").mock(
-            return_value=httpx.Response(200, json=mock_episodes_response)
-        )
-
-        result = await repo.get_series_info(1, [1])
-        assert isinstance(result, MediaInfoDTO)
-        assert result.title == "Test Series"
-        assert result.available is True
-        assert result.poster == "http://test.com/poster.jpg"
-        assert result.available_since == datetime(
-            2024, 1, 2, 12, 0, tzinfo=timezone.utc
-        )
-        assert result.size_on_disk == 1000000
-        assert result.seasons == [1]
-
-
-@pytest.mark.asyncio
-async def test_get_series_info_unavailable(
-    repo, base_url, mock_series_response, mock_episodes_response
+    monkeypatch.setattr(repo, "max_concurrent_deletes", max_concurrent)
+    in_flight = 0
+    max_in_flight = 0
+
+    async def delete_file(request):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return httpx.Response(200)
+
+    delete_files = respx_mock.delete(path__regex=r"^/api/v3/episodefile/\d+$").mock(
+        side_effect=delete_file
+    )
+
+    await repo.delete_episode_files([101, 102, 103])
+    assert delete_files.call_count == 3
+    assert max_in_flight == expected_in_flight
+
+
+@pytest.mark.parametrize(
+    "failure,expected_error",
+    [
+        (httpx.Response(500), httpx.HTTPStatusError),
+        (httpx.ConnectError, httpx.ConnectError),
+    ],
+    ids=["server_error", "connect_error"],
+)
+async def test_delete_episode_files_cancels_pending_on_failure(
+    repo, respx_mock, failure, expected_error
 ):
-    mock_episodes_response[0]["hasFile"] = False
-
-    with respx.mock(base_url=base_url) as respx_mock:
-        respx_mock.get("/api/v3/series/1").mock(
-            return_value=httpx.Response(200, json=mock_series_response)
-        )
-        respx_mock.get("/api/v3/episode").mock(
-            return_value=httpx.Response(200, json=mock_episodes_response)
-        )
-
-        result = await repo.get_series_info(1, [1])
-        assert result.available is False
-        assert result.available_since is None
-
-
-@pytest.mark.asyncio
-async def test_get_episodes(repo, base_url, mock_episodes_response):
-    with respx.mock(base_url=base_url) as respx_mock:
-        respx_mock.get("/api/v3/episode").mock(
-            return_value=httpx.Response(200, json=mock_episodes_response)
-        )
-
-        result = await repo.get_episodes(1, 1)
-        assert result == mock_episodes_response
-        assert dict(respx_mock.calls.last.request.url.params) == {
-            "seriesId": "1",
-            "seasonNumber": "1",
-            "includeEpisodeFile": "true",
-        }
-
-
-@pytest.mark.asyncio
-async def test_delete_series_seasons(repo, base_url, mock_series_response):
-    mock_episodes_with_files = [
-        {
-            "seasonNumber": 1,
-            "episodeNumber": 1,
-            "hasFile": True,
-            "episodeFileId": 101,
-        }
-    ]
-
-    with respx.mock(base_url=base_url) as respx_mock:
-        get_series = respx_mock.get("/api/v3/series/1").mock(
-            return_value=httpx.Response(200, json=mock_series_response)
-        )
-        put_series = respx_mock.put("/api/v3/series/1").mock(
-            return_value=httpx.Response(200)
-        )
-        get_episodes = respx_mock.get("/api/v3/episode").mock(
-            return_value=httpx.Response(200, json=mock_episodes_with_files)
-        )
-        delete_file = respx_mock.delete("/api/v3/episodefile/101").mock(
-            return_value=httpx.Response(200)
-        )
-
-        await repo.delete_series_seasons(1, [1])
-
-        # Verify all expected calls were made
-        assert get_series.called
-        assert put_series.called
-        assert get_episodes.called
-        assert delete_file.called
-
-        # Verify the PUT request updated monitoring
-        put_request = next(
-            call for call in respx_mock.calls if call.request.method == "PUT"
-        )
-        sent_data = json.loads(put_request.request.read().decode())
-        assert sent_data["seasons"][0]["monitored"] is False
-
-
-@pytest.mark.asyncio
-async def test_delete_season_files(repo, base_url, mock_episodes_response):
-    with respx.mock(base_url=base_url) as respx_mock:
-        respx_mock.get("/api/v3/episode").mock(
-            return_value=httpx.Response(200, json=mock_episodes_response)
-        )
-        delete_101 = respx_mock.delete("/api/v3/episodefile/101").mock(
-            return_value=httpx.Response(200)
-        )
-        delete_102 = respx_mock.delete("/api/v3/episodefile/102").mock(
-            return_value=httpx.Response(200)
-        )
-
-        await repo.delete_season_files(1, [1])
-        assert delete_101.called
-        assert delete_102.called
-
-
-@pytest.mark.asyncio
-async def test_delete_episode_files(repo, base_url):
-    with respx.mock(base_url=base_url) as respx_mock:
-        delete_101 = respx_mock.delete("/api/v3/episodefile/101").mock(
-            return_value=httpx.Response(200)
-        )
-        delete_102 = respx_mock.delete("/api/v3/episodefile/102").mock(
-            return_value=httpx.Response(200)
-        )
-
-        await repo.delete_episode_files([101, 102])
-        assert delete_101.called
-        assert delete_102.called
-
-
-@pytest.mark.asyncio
-@pytest.mark.asyncio
-async def test_update_season_monitoring(repo, base_url, mock_series_response):
-    with respx.mock(base_url=base_url) as respx_mock:
-        respx_mock.get("/api/v3/series/1").mock(
-            return_value=httpx.Response(200, json=mock_series_response)
-        )
-        respx_mock.put("/api/v3/series/1").mock(return_value=httpx.Response(200))
-
-        await repo.update_season_monitoring(1, [1])
-
-        # Verify PUT request
-        put_request = next(
-            call for call in respx_mock.calls if call.request.method == "PUT"
-        )
-        sent_data = json.loads(put_request.request.read().decode())
-
-        # Check season monitoring status
-        assert sent_data["seasons"][0]["seasonNumber"] == 1
-        assert sent_data["seasons"][0]["monitored"] is False
-        assert sent_data["seasons"][1]["monitored"] is True
+    cancelled = False
+
+    async def delete_file(request):
+        nonlocal cancelled
+        if request.url.path.endswith("/102"):
+            if isinstance(failure, httpx.Response):
+                return failure
+            raise failure("Connection refused", request=request)
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+
+    respx_mock.delete(path__regex=r"^/api/v3/episodefile/\d+$").mock(
+        side_effect=delete_file
+    )
+
+    # A regression leaves 101 pending forever, fail fast instead of hanging
+    async with asyncio.timeout(1):
+        with pytest.raises(expected_error):
+            await repo.delete_episode_files([101, 102])
+    assert cancelled
+
+
+async def test_update_season_monitoring(repo, respx_mock, series_route):
+    put_series = respx_mock.put("/api/v3/series/1").mock(
+        return_value=httpx.Response(200)
+    )
+
+    await repo.update_season_monitoring(1, [1])
+
+    # Verify PUT request
+    put_request = put_series.calls.last.request
+    sent_data = json.loads(put_request.read())
+
+    # Check season monitoring status
+    assert sent_data["seasons"][0]["seasonNumber"] == 1
+    assert sent_data["seasons"][0]["monitored"] is False
+    assert sent_data["seasons"][1]["monitored"] is True
@@ -0,0 +1,34 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+RENDERED = "<html>Test</html>"
+
+
+@pytest.fixture(scope="module")
+def _fastmail_class():
+    with patch("scruffy.services.email_service.FastMail") as mock:
+        mock.return_value.send_message = AsyncMock()
+        yield mock
+
+
+@pytest.fixture(scope="module")
+def _template():
+    template = MagicMock()
+    template.render.return_value = RENDERED
+    with patch("scruffy.services.email_service.Environment") as mock_env:
+        mock_env.return_value.get_template.return_value = template
+        yield template
+
+
+@pytest.fixture
+def mock_fastmail(_fastmail_class):
+    instance = _fastmail_class.return_value
+    instance.send_message.reset_mock()
+    return instance
+
+
+@pytest.fixture
+def mock_template(_template):
+    _template.reset_mock()
+    return _template
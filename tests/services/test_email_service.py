@@ -1,5 +1,4 @@
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi_mail import MessageSchema
@@ -8,39 +7,10 @@ from pydantic import SecretStr
 from scruffy.infra import MediaInfoDTO
 from scruffy.services.email_service import EmailService
 
+TEMPLATE_PATH = Path(__file__).resolve().parents[2] / "scruffy" / "templates"
 
-@pytest.fixture
-def mock_settings():
-    with patch("scruffy.services.email_service.settings") as mock_settings:
-        mock_settings.email_enabled = True
-        mock_settings.smtp_username = "test"
-        mock_settings.smtp_password = "test"
-        mock_settings.smtp_from_email = "from@test.com"
-        mock_settings.smtp_port = 587
-        mock_settings.smtp_host = "smtp.test.com"
-        mock_settings.smtp_ssl_tls = False
-        mock_settings.smtp_starttls = True
-        yield mock_settings
 
-
-@pytest.fixture
-def mock_fastmail():
-    with patch("scruffy.services.email_service.FastMail") as mock:
-        instance = mock.return_value
-        instance.send_message = AsyncMock()
-        yield instance
-
-
-@pytest.fixture
-def mock_template():
-    with patch("scruffy.services.email_service.Environment") as mock_env:
-        template_mock = MagicMock()
-        template_mock.render.return_value = "<html>Test</html>"
-        mock_env.return_value.get_template.return_value = template_mock
-        yield template_mock
-
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def media_info():
     return MediaInfoDTO(
         title="Test Movie",
@@ -53,29 +23,33 @@ def media_info():
     )
 
 
-def test_service_initialization_disabled(mock_settings):
-    mock_settings.email_enabled = False
-    service = EmailService()
-    assert not hasattr(service, "fastmail")
-
-
-def test_service_initialization_no_credentials(mock_settings):
-    mock_settings.smtp_username = None
-    mock_settings.smtp_password = None
+@pytest.mark.parametrize(
+    "enabled,username,password,use_credentials",
+    [
+        (False, "test", "test", None),
+        (True, "test", "test", True),
+        (True, None, None, False),
+    ],
+    ids=["disabled", "with_credentials", "no_credentials"],
+)
+def test_service_initialization(
+    configured_settings, monkeypatch, enabled, username, password, use_credentials
+):
+    monkeypatch.setattr(configured_settings, "email_enabled", enabled)
+    monkeypatch.setattr(configured_settings, "smtp_username", username)
+    monkeypatch.setattr(configured_settings, "smtp_password", password)
     service = EmailService()
-    assert service.conf.USE_CREDENTIALS is False
 
-
-def test_service_initialization_with_credentials(mock_settings):
-    service = EmailService()
-    assert service.conf.USE_CREDENTIALS is True
-    assert service.conf.MAIL_USERNAME == "test"
-    assert service.conf.MAIL_PASSWORD == SecretStr("test")
+    if use_credentials is None:
+        assert not hasattr(service, "fastmail")
+        return
+    assert service.conf.USE_CREDENTIALS is use_credentials
+    assert service.conf.MAIL_USERNAME == (username or "")
+    assert service.conf.MAIL_PASSWORD == SecretStr(password or "")
 
 
-@pytest.mark.asyncio
 async def test_send_deletion_notice(
-    mock_settings, mock_fastmail, mock_template, media_info
+    configured_settings, mock_fastmail, mock_template, media_info
 ):
     service = EmailService()
     await service.send_deletion_notice("test@test.com", media_info)
@@ -87,9 +61,8 @@ async def test_send_deletion_notice(
     assert call_args.recipients == ["test@test.com"]
 
 
-@pytest.mark.asyncio
 async def test_send_reminder_notice(
-    mock_settings, mock_fastmail, mock_template, media_info
+    configured_settings, mock_fastmail, mock_template, media_info
 ):
     service = EmailService()
     days_left = 7
@@ -102,7 +75,7 @@ async def test_send_reminder_notice(
     assert call_args.recipients == ["test@test.com"]
 
 
-def test_template_rendering(mock_settings, mock_template, media_info):
+def test_template_rendering(configured_settings, mock_template, media_info):
     service = EmailService()
     mock_template.render.assert_not_called()
 
@@ -110,5 +83,4 @@ def test_template_rendering(mock_settings, mock_template, media_info):
     mock_template.render.assert_not_called()
 
     # Verify template path exists
-    template_path = Path(__file__).parent.parent.parent / "scruffy" / "templates"
-    assert template_path.exists()
+    assert TEMPLATE_PATH.exists()
@@ -1,5 +1,6 @@
 import logging
 import sys
+from logging.handlers import RotatingFileHandler
 
 import pytest
 
@@ -8,17 +9,27 @@ from scruffy.logging import setup_logger
 
 @pytest.fixture(autouse=True)
 def cleanup_logging():
-    yield
-    # Clear all handlers after each test
     root = logging.getLogger()
-    root.handlers.clear()
-    # Clear any loggers created during tests
-    logging.Logger.manager.loggerDict.clear()
+    root_handlers = list(root.handlers)
+    logger_dict = logging.Logger.manager.loggerDict
+    existing_loggers = set(logger_dict)
+    yield
+    # Only undo what the test added, leave loggers owned by other modules alone
+    if root.handlers != root_handlers:
+        root.handlers[:] = root_handlers
+    for name in logger_dict.keys() - existing_loggers:
+        del logger_dict[name]
+
 
+@pytest.fixture(scope="session")
+def temp_log_file(tmp_path_factory):
+    return tmp_path_factory.mktemp("logs") / "test.log"
 
-@pytest.fixture
-def temp_log_file(tmp_path):
-    return tmp_path / "test.log"
+
+@pytest.fixture(autouse=True)
+def truncate_log_file(temp_log_file):
+    # The log file is shared across the session, start each test empty
+    temp_log_file.write_text("")
 
 
 def test_setup_logger_basic():
@@ -26,7 +37,15 @@ def test_setup_logger_basic():
 
     assert logger.name == "test"
     assert logger.level == logging.INFO
-    assert len(logger.handlers) == 1
+
+
+@pytest.mark.parametrize(
+    "with_file,expected_handlers", [(False, 1), (True, 2)], ids=["stdout", "file"]
+)
+def test_setup_logger_handlers(temp_log_file, with_file, expected_handlers):
+    logger = setup_logger("test", log_file=temp_log_file if with_file else None)
+
+    assert len(logger.handlers) == expected_handlers
     assert isinstance(logger.handlers[0], logging.StreamHandler)
     assert logger.handlers[0].stream == sys.stdout
 
@@ -34,8 +53,7 @@ def test_setup_logger_basic():
 def test_setup_logger_with_file(temp_log_file):
     logger = setup_logger("test", log_file=temp_log_file)
 
-    assert len(logger.handlers) == 2
-    assert isinstance(logger.handlers[1], logging.handlers.RotatingFileHandler)
+    assert isinstance(logger.handlers[1], RotatingFileHandler)
     assert logger.handlers[1].baseFilename == str(temp_log_file)
     assert logger.handlers[1].maxBytes == 10_000_000
     assert logger.handlers[1].backupCount == 5
@@ -65,13 +83,12 @@ def test_logger_writes_to_file(temp_log_file):
     assert test_message in log_content
 
 
-def test_logger_rotating_file(temp_log_file):
-    logger = setup_logger("test", log_file=temp_log_file)
-    handler = logger.handlers[1]
+def test_setup_logger_idempotent():
+    logger = setup_logger("test", log_file=None)
+    handlers_before = list(logger.handlers)
 
-    assert isinstance(handler, logging.handlers.RotatingFileHandler)
-    assert handler.maxBytes == 10_000_000
-    assert handler.backupCount == 5
+    assert setup_logger("test", log_file=None) is logger
+    assert logger.handlers == handlers_before
 
 
 def test_setup_logger_invalid_level():
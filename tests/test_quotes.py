@@ -1,5 +1,10 @@
+import pytest
+
 from scruffy.quotes import scruffy_quotes
 
+# Potentially problematic characters in email bodies
+INVALID_CHARS = frozenset("\x00\n\r")
+
 
 def test_quotes_is_list():
     assert isinstance(scruffy_quotes, list)
@@ -9,16 +14,8 @@ def test_quotes_not_empty():
     assert len(scruffy_quotes) > 0
 
 
-def test_quotes_are_strings():
-    for quote in scruffy_quotes:
-        assert isinstance(quote, str)
-        assert len(quote) > 0
-
-
-def test_quotes_are_email_safe():
-    # Check for potentially problematic characters in email bodies
-    invalid_chars = ["\x00", "\n", "\r"]
-
-    for quote in scruffy_quotes:
-        for char in invalid_chars:
-            assert char not in quote, f"Quote contains invalid character: {char}"
+@pytest.mark.parametrize("quote", scruffy_quotes)
+def test_quote_is_valid(quote):
+    assert isinstance(quote, str)
+    assert len(quote) > 0
+    assert not INVALID_CHARS.intersection(quote)